@@ -9,17 +9,52 @@ Website: https://www.lincolncommonapartments.com/floorplans
 """
 
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 import logging
-from datetime import datetime
-from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import atexit
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+import hashlib
+import json
+import re
+import argparse
+import signal
+import threading
+import types
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, List, Dict, Optional, Tuple
 import os
 import sys
 
+if TYPE_CHECKING:
+    import smtplib
+
+# orjson speeds up the cache file when installed. The stdlib fallback is set up to
+# produce the same bytes, so unit digests match whichever one wrote them.
+try:
+    import orjson
+    
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, sort_keys=True, separators=(',', ':'), ensure_ascii=False).encode()
+    
+    _loads = json.loads
+
+# lxml does the HTML parsing; there is no pure-Python fallback
+try:
+    import lxml.html
+    from lxml import etree
+except ImportError:
+    print("Error: lxml not found. Please install dependencies: pip install -r requirements.txt")
+    sys.exit(1)
+
 # Import configuration
 try:
     from config import (
@@ -31,61 +66,519 @@ except ImportError:
     print("Error: config.py not found. Please copy config.py.example to config.py and configure your settings.")
     sys.exit(1)
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('apartment_monitor.log'),
-        logging.StreamHandler()
-    ]
-)
+_LOG_LEVELS = {
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+}
+
+
+def _check_settings() -> int:
+    """Validate monitoring settings at startup and return the resolved log level"""
+    errors = []
+    # max_interval_minutes is optional, the others are required
+    positive_keys = ['check_interval_minutes', 'timeout_seconds']
+    if 'max_interval_minutes' in MONITORING_SETTINGS:
+        positive_keys.append('max_interval_minutes')
+    for key in positive_keys:
+        value = MONITORING_SETTINGS.get(key)
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+            errors.append(f"MONITORING_SETTINGS['{key}'] must be a positive number, got {value!r}")
+    
+    max_retries = MONITORING_SETTINGS.get('max_retries')
+    if isinstance(max_retries, bool) or not isinstance(max_retries, int) or max_retries < 0:
+        errors.append(f"MONITORING_SETTINGS['max_retries'] must be a non-negative integer, got {max_retries!r}")
+    
+    api_url = MONITORING_SETTINGS.get('floorplans_api_url')
+    if api_url is not None and not (isinstance(api_url, str) and api_url.startswith(('http://', 'https://'))):
+        errors.append(f"MONITORING_SETTINGS['floorplans_api_url'] must be an http(s) URL or None, got {api_url!r}")
+    
+    log_level = str(MONITORING_SETTINGS.get('log_level', 'INFO')).upper()
+    if log_level not in _LOG_LEVELS:
+        errors.append(f"MONITORING_SETTINGS['log_level'] must be one of {', '.join(_LOG_LEVELS)}, got {log_level!r}")
+    
+    if errors:
+        for error in errors:
+            print(f"Error: {error}")
+        print("Please fix these settings in config.py.")
+        sys.exit(1)
+    return _LOG_LEVELS[log_level]
+
+
+# Configure logging. Records are queued by the calling thread and written to the
+# log file and console by a background listener, so checks never wait on log I/O.
+_log_level = _check_settings()
+_log_formatter = logging.Formatter('{asctime} - {levelname} - {message}', style='{')
+_log_formatter.default_msec_format = None
+_log_handlers = [
+    RotatingFileHandler('apartment_monitor.log', maxBytes=1_000_000, backupCount=3),
+    logging.StreamHandler()
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+_log_queue = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, *_log_handlers)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+logging.root.setLevel(_log_level)
+logging.root.addHandler(QueueHandler(_log_queue))
 logger = logging.getLogger(__name__)
 
+# Region of the page holding the floorplan listings, most specific first; the rest
+# of the page is navigation, scripts and footer
+_FIND_LISTING_REGION = (
+    etree.XPath("//*[@id='floorplans']"),
+    etree.XPath("//*[contains(@data-module, 'floorplan')]"),
+    etree.XPath("//main"),
+)
+
+# Floorplan containers: <div>/<section> elements whose class mentions one of these
+# keywords, case-insensitively ('plan' also covers 'floorplan'). Compiled once and
+# evaluated by libxml2, so no Python callback or string allocation per node.
+_CONTAINER_CLASS_KEYWORDS = ('plan', 'unit', 'apartment')
+_CLASS_LOWER = "translate(@class, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+_CLASS_MATCH = ' or '.join(f"contains({_CLASS_LOWER}, '{keyword}')" for keyword in _CONTAINER_CLASS_KEYWORDS)
+_FIND_CONTAINERS = etree.XPath(f"descendant-or-self::*[self::div or self::section][@class][{_CLASS_MATCH}]")
+
+# One-bedroom and ARO indicators, matched together in a single pass over the text.
+# Word boundaries keep "aro" from matching inside words like "carousel"; "bedroom"
+# needs none, so run-together text like "1Bedroom" still counts.
+_BEDROOM_PATTERN = r'(?:\b1\s*br\b|bedroom)'
+_ARO_PATTERN = r'\b(?:aro|affordable|rental opportunity)\b'
+_KEYWORD_SCANNER = re.compile(f'(?P<bedroom>{_BEDROOM_PATTERN})|(?P<aro>{_ARO_PATTERN})', re.IGNORECASE)
+_ARO_KEYWORDS = re.compile(_ARO_PATTERN, re.IGNORECASE)
+
+
+def _is_aro_one_bedroom(text: str) -> bool:
+    """Return True once both a one-bedroom and an ARO indicator have been seen"""
+    found = set()
+    for match in _KEYWORD_SCANNER.finditer(text):
+        found.add(match.lastgroup)
+        if len(found) == 2:
+            return True
+    return False
+
+
+# Unit fields, matched against the container text
+_AVAILABILITY_PATTERN = re.compile(r'\b(?:available|ready|vacant)\b[^.\n$]{0,40}', re.IGNORECASE)
+_PRICE_PATTERN = re.compile(r'\$[\d,]+(?:\.\d{2})?')
+_SQFT_PATTERN = re.compile(r'[\d,]+\s*(?:sq\.?\s*ft|sqft)\b\.?', re.IGNORECASE)
+
+# Unit fields are short labels; cap them so a stray paragraph isn't carried into notifications
+_MAX_FIELD_LENGTH = 80
+
+
+def _element_text(element: etree._Element) -> str:
+    """Return all text under element, with text nodes separated by spaces"""
+    return ' '.join(element.itertext())
+
+
+_HEADING_TAGS = frozenset({'h1', 'h2', 'h3', 'h4'})
+
+
+def _read_container(container: etree._Element) -> Tuple[str, Optional[str]]:
+    """Collect a container's text and its title in a single walk over its subtree
+    
+    Returns the text, with text nodes separated by spaces, and the text of the
+    first h1-h4 heading that mentions a bedroom, or None.
+    """
+    parts = []
+    heading = None
+    heading_start = 0
+    title = None
+    for event, element in etree.iterwalk(container, events=('start', 'end', 'comment', 'pi')):
+        if event == 'start':
+            if heading is None and title is None and element.tag in _HEADING_TAGS:
+                heading, heading_start = element, len(parts)
+            if element.text:
+                parts.append(element.text)
+            continue
+        
+        if element is heading:
+            heading_text = ' '.join(parts[heading_start:])
+            if 'bedroom' in heading_text.lower():
+                title = heading_text
+            heading = None
+        # Text after an element, comment or processing instruction belongs to its parent
+        if element.tail and element is not container:
+            parts.append(element.tail)
+    return ' '.join(parts), title
+
+
+def _clean_text(text: str) -> str:
+    """Collapse whitespace and clip text to a short label"""
+    return ' '.join(text.split())[:_MAX_FIELD_LENGTH]
+
+
+def _listing_region(root: lxml.html.HtmlElement) -> etree._Element:
+    """Return the element holding the floorplan listings, or the whole page if none is found"""
+    for find_region in _FIND_LISTING_REGION:
+        matches = find_region(root)
+        if matches:
+            return matches[0]
+    return root
+
+
+# Floorplan tables: header patterns (searched in the lowercased label, first match wins)
+# mapped to unit fields. "Units Available" is availability and "Unit Type" is not a
+# unit name; 'plan' names units only in tables without a unit column, and 'bedrooms'
+# only selects rows and is not reported.
+_TABLE_HEADER_FIELDS = (
+    (re.compile(r'avail'), 'availability'),
+    (re.compile(r'^units?\b(?!\s*type)'), 'name'),
+    (re.compile(r'plan'), 'plan'),
+    (re.compile(r'bed'), 'bedrooms'),
+    (re.compile(r'rent|price'), 'price'),
+    (re.compile(r'sq'), 'sqft'),
+)
+# A bedrooms cell for a one-bedroom unit: "1", "1 Bed", "1BR", "1/1", but not "10" or "1.5"
+_ONE_BEDROOM_CELL = re.compile(r'\s*1(?:\.0+)?(?![\d.])')
+_FIND_TABLES = etree.XPath("descendant-or-self::table")
+_FIND_HEADER_CELLS = etree.XPath("(.//tr[th])[1]/th")
+_FIND_DATA_ROWS = etree.XPath(".//tr[td]")
+_FIND_ROW_CELLS = etree.XPath("*[self::td or self::th]")
+
+
+def _table_columns(table: etree._Element) -> Dict[int, str]:
+    """Map column positions of a floorplan table to unit fields, or {} for other tables"""
+    columns = {}
+    for index, cell in enumerate(_FIND_HEADER_CELLS(table)):
+        label = ' '.join(_element_text(cell).split()).lower()
+        for pattern, field in _TABLE_HEADER_FIELDS:
+            if pattern.search(label):
+                columns[index] = field
+                break
+    
+    has_unit_column = 'name' in columns.values()
+    for index in [index for index, field in columns.items() if field == 'plan']:
+        if has_unit_column:
+            del columns[index]
+        else:
+            columns[index] = 'name'
+    
+    # A floorplan table names its units and says something about each of them
+    fields = set(columns.values())
+    return columns if 'name' in fields and fields & {'availability', 'price'} else {}
+
+
+def _find_table_units(region: etree._Element) -> List[Dict[str, str]]:
+    """Find ARO one-bedroom units listed one per row in floorplan tables"""
+    units = []
+    for table in _FIND_TABLES(region):
+        columns = _table_columns(table)
+        if not columns:
+            continue
+        bedroom_index = next((index for index, field in columns.items() if field == 'bedrooms'), None)
+        
+        for row in _FIND_DATA_ROWS(table):
+            cells = [_element_text(cell) for cell in _FIND_ROW_CELLS(row)]
+            row_text = ' '.join(cells)
+            # With a bedrooms column, ARO can come from any cell (typically a type column)
+            if bedroom_index is None:
+                if not _is_aro_one_bedroom(row_text):
+                    continue
+            elif (bedroom_index >= len(cells) or not _ONE_BEDROOM_CELL.match(cells[bedroom_index])
+                  or not _ARO_KEYWORDS.search(row_text)):
+                continue
+            
+            unit_info = {}
+            for index, field in columns.items():
+                if index >= len(cells) or field == 'bedrooms' or field in unit_info:
+                    continue
+                value = cells[index]
+                if field == 'price':
+                    price_match = _PRICE_PATTERN.search(value)
+                    value = price_match.group() if price_match else value
+                value = _clean_text(value)
+                if value:
+                    unit_info[field] = value
+            if unit_info:
+                units.append(unit_info)
+    return units
+
+
+# Unit fields copied from a floorplans API response, named as in extract_unit_info
+_API_UNIT_FIELDS = ('name', 'availability', 'price', 'sqft')
+
+
+def _api_units(data) -> Optional[List[Dict[str, str]]]:
+    """Find ARO one-bedroom units in a floorplans API response
+    
+    Returns None if the response is not a {'units': [...]} object.
+    """
+    units = data.get('units') if isinstance(data, dict) else None
+    if not isinstance(units, list):
+        return None
+    
+    aro_units = []
+    for unit in units:
+        if not isinstance(unit, dict) or unit.get('bedrooms') != 1:
+            continue
+        tags = unit.get('tags')
+        if not isinstance(tags, list) or 'ARO' not in tags:
+            continue
+        aro_units.append({
+            field: _clean_text(str(unit[field]))
+            for field in _API_UNIT_FIELDS
+            if unit.get(field) is not None
+        })
+    return aro_units
+
+
+# Returned by fetch_page when the server reports the page unchanged (HTTP 304)
+NOT_MODIFIED = object()
+
+# Conditional-GET validators and the last result, kept between runs
+CACHE_FILE = '.cache.json'
+
+
+def _source_digest() -> str:
+    """Return a fingerprint of this module's code"""
+    with open(__file__, 'rb') as f:
+        return hashlib.blake2b(f.read(), digest_size=8).hexdigest()
+
+
+# Saved units and page hashes are only valid for the parsing code that produced
+# them; the cache file is discarded when this changes
+_CACHE_VERSION = _source_digest()
+
+# Cap on the polling backoff: the interval doubles at most this many times
+_MAX_BACKOFF_DOUBLINGS = 6
+
+
+def _timestamp() -> str:
+    """Return the current UTC time as an ISO 8601 string"""
+    return datetime.now(timezone.utc).isoformat(timespec='seconds')
+
+
+def _units_digest(units: List[Dict[str, str]]) -> str:
+    """Return a digest identifying a set of units, independent of their order"""
+    normalized = sorted(_dumps(unit) for unit in units)
+    return hashlib.blake2b(b'\n'.join(normalized), digest_size=16).hexdigest()
+
+
+# lxml parsers are not thread-safe, so each thread keeps its own for reuse
+_parser_local = threading.local()
+
+
+def _get_parser() -> lxml.html.HTMLParser:
+    """Return this thread's HTML parser, creating it on first use
+    
+    Comments, processing instructions and whitespace-only text are dropped while
+    parsing, so later tree walks have fewer nodes to visit.
+    """
+    parser = getattr(_parser_local, 'parser', None)
+    if parser is None:
+        parser = lxml.html.HTMLParser(remove_comments=True, remove_pis=True, remove_blank_text=True)
+        _parser_local.parser = parser
+    return parser
+
+
+class _HashingReader:
+    """File-like wrapper that hashes the body as the parser reads it"""
+    
+    def __init__(self, raw):
+        self._raw = raw
+        self._hash = hashlib.blake2b(digest_size=16)
+    
+    def read(self, size: int = -1) -> bytes:
+        data = self._raw.read(size)
+        self._hash.update(data)
+        return data
+    
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+# Notification email body; units are rendered with _UNIT_TEMPLATE and joined
+_EMAIL_TEMPLATE = """
+ARO One-Bedroom Units Available at Lincoln Commons!
+
+Found {count} available ARO one-bedroom unit(s):
+
+{units}
+Check the website for more details and to apply:
+{url}
+
+This alert was generated at: {timestamp}
+"""
+
+_UNIT_TEMPLATE = """
+Unit {index}:
+- Name: {name}
+- Availability: {availability}
+- Price: {price}
+- Square Footage: {sqft}
+
+"""
+
+def _create_session() -> requests.Session:
+    """Build the HTTP session used for all page fetches"""
+    session = requests.Session()
+    # Keep the connection alive between checks and retry transient server errors
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=4,
+        max_retries=Retry(
+            total=MONITORING_SETTINGS['max_retries'],
+            backoff_factor=0.5,
+            status_forcelist=(500, 502, 503, 504)
+        )
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# Shared by every monitor in the process, so the HTTPS connection (and its TLS
+# session) outlives a single check
+_SHARED_SESSION = _create_session()
+
 class LincolnCommonsMonitor:
     """Monitor Lincoln Commons website for ARO apartment availability"""
     
+    # Sent with every request rather than set on the shared session, so a subclass
+    # can override them without affecting other monitors; ask for HTML, compressed
+    _DEFAULT_HEADERS = types.MappingProxyType({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+        'Accept-Encoding': 'br, gzip, deflate',
+        'Accept': 'text/html,application/xhtml+xml',
+        'Accept-Language': 'en-US,en;q=0.9'
+    })
+    
     def __init__(self):
         self.base_url = "https://www.lincolncommonapartments.com/floorplans"
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+        self.session = _SHARED_SESSION
+        # Validators from the last successful fetch, sent back as a conditional GET,
+        # and the units found by that fetch, returned again when the page is unchanged
+        self._cache = self._load_cache()
+        # Logged-in SMTP connection, opened on first notification and reused afterwards
+        self._smtp = None
+        # Set by stop() to end run_continuously without waiting out the interval
+        self._stop_event = threading.Event()
+        
+    def fetch_page(self) -> Optional[lxml.html.HtmlElement]:
+        """Fetch and parse the floorplans page
         
-    def fetch_page(self) -> Optional[BeautifulSoup]:
-        """Fetch and parse the floorplans page"""
+        Returns NOT_MODIFIED if the page is unchanged since the last fetch.
+        """
         try:
-            logger.info(f"Fetching page: {self.base_url}")
-            response = self.session.get(self.base_url, timeout=30)
-            response.raise_for_status()
+            headers = dict(self._DEFAULT_HEADERS)
+            if self._cache.get('etag'):
+                headers['If-None-Match'] = self._cache['etag']
+            if self._cache.get('last_modified'):
+                headers['If-Modified-Since'] = self._cache['last_modified']
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Fetching page: {self.base_url}")
+            with self.session.get(self.base_url, headers=headers, stream=True,
+                                  timeout=MONITORING_SETTINGS['timeout_seconds']) as response:
+                if response.status_code == 304:
+                    logger.info("Page not modified since last fetch")
+                    return NOT_MODIFIED
+                response.raise_for_status()
+                
+                # Parse straight from the decompressed stream rather than
+                # buffering the whole body in response.content first
+                response.raw.decode_content = True
+                body = _HashingReader(response.raw)
+                root = lxml.html.parse(body, parser=_get_parser()).getroot()
+                if root is None:
+                    raise etree.ParserError("Document is empty")
+                
+                self._cache['etag'] = response.headers.get('ETag')
+                self._cache['last_modified'] = response.headers.get('Last-Modified')
             logger.info("Successfully fetched and parsed page")
-            return soup
             
-        except requests.exceptions.RequestException as e:
+            # Servers without validators always answer 200; compare content instead
+            content_hash = body.hexdigest()
+            if content_hash == self._cache.get('content_hash'):
+                logger.info("Page content unchanged since last fetch")
+                return NOT_MODIFIED
+            self._cache['content_hash'] = content_hash
+            return root
+            
+        except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError) as e:
             logger.error(f"Error fetching page: {e}")
             return None
+        except etree.LxmlError as e:
+            logger.error(f"Error parsing page: {e}")
+            return None
     
-    def find_aro_units(self, soup: BeautifulSoup) -> List[Dict[str, str]]:
+    def fetch_api_units(self) -> Optional[List[Dict[str, str]]]:
+        """Fetch ARO one-bedroom units from the floorplans API, if one is configured
+        
+        Returns NOT_MODIFIED if the units are the same as last check, or None if
+        the API is not configured or could not be used, so the page is scraped instead.
+        """
+        api_url = MONITORING_SETTINGS.get('floorplans_api_url')
+        if not api_url:
+            return None
+        
+        try:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Fetching floorplans API: {api_url}")
+            with self.session.get(api_url, headers={**self._DEFAULT_HEADERS, 'Accept': 'application/json'},
+                                  timeout=MONITORING_SETTINGS['timeout_seconds']) as response:
+                response.raise_for_status()
+                data = _loads(response.content)
+        except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError) as e:
+            logger.warning(f"Error fetching floorplans API, falling back to page: {e}")
+            return None
+        except ValueError as e:
+            logger.warning(f"Floorplans API returned invalid JSON, falling back to page: {e}")
+            return None
+        
+        units = _api_units(data)
+        if units is None:
+            logger.warning("Unexpected floorplans API response, falling back to page")
+            return None
+        logger.info(f"Found {len(units)} ARO one-bedroom units from floorplans API")
+        if units == self._cache.get('units'):
+            return NOT_MODIFIED
+        return units
+    
+    def find_aro_units(self, root: lxml.html.HtmlElement) -> List[Dict[str, str]]:
         """Find ARO one-bedroom units from the parsed page"""
         aro_units = []
         
         try:
             # Look for floorplan containers - this may need adjustment based on actual site structure
-            floorplan_containers = soup.find_all(['div', 'section'], class_=lambda x: x and any(
-                keyword in x.lower() for keyword in ['floorplan', 'unit', 'apartment', 'plan']
-            ))
-            
-            for container in floorplan_containers:
-                # Look for one-bedroom indicators
-                text_content = container.get_text().lower()
-                if 'bedroom' in text_content or '1br' in text_content or '1 br' in text_content:
-                    # Check for ARO indicators
-                    if any(keyword in text_content for keyword in ['aro', 'affordable', 'rental opportunity']):
-                        unit_info = self.extract_unit_info(container)
-                        if unit_info:
-                            aro_units.append(unit_info)
+            region = _listing_region(root)
+            
+            # Without any ARO mention in the listings no container can match
+            if not _ARO_KEYWORDS.search(_element_text(region)):
+                logger.info("No ARO listings mentioned on page")
+                return []
+            
+            # Floorplan tables list one unit per row; read them column by column when present,
+            # and fall back to the container scan when they list no matching unit
+            table_units = _find_table_units(region)
+            if table_units:
+                logger.info(f"Found {len(table_units)} ARO one-bedroom units in floorplan tables")
+                return table_units
+            
+            # Nested matches (e.g. a listing section and its unit cards) would
+            # otherwise be reported more than once. Scan innermost first and skip
+            # containers wrapping one that already gave a unit; a card whose
+            # matched children (e.g. 'unit-price') give nothing is still read.
+            reported = set()
+            for container in reversed(_FIND_CONTAINERS(region)):
+                if container in reported:
+                    continue
+                # Look for one-bedroom and ARO indicators
+                text, title = _read_container(container)
+                if _is_aro_one_bedroom(text):
+                    unit_info = self.extract_unit_info(container, text, title)
+                    if unit_info:
+                        aro_units.append(unit_info)
+                        for ancestor in container.iterancestors():
+                            if ancestor in reported:
+                                break
+                            reported.add(ancestor)
+            # Back to page order
+            aro_units.reverse()
             
             logger.info(f"Found {len(aro_units)} ARO one-bedroom units")
             return aro_units
@@ -94,32 +587,36 @@ class LincolnCommonsMonitor:
             logger.error(f"Error parsing ARO units: {e}")
             return []
     
-    def extract_unit_info(self, container) -> Optional[Dict[str, str]]:
-        """Extract unit information from a container element"""
+    def extract_unit_info(self, container, text: Optional[str] = None,
+                          title: Optional[str] = None) -> Optional[Dict[str, str]]:
+        """Extract unit information from a container element
+        
+        text and title are the results of _read_container, if the caller has
+        already collected them.
+        """
         try:
+            if text is None:
+                text, title = _read_container(container)
             unit_info = {}
             
             # Extract unit name/number
-            title_elem = container.find(['h1', 'h2', 'h3', 'h4'], string=lambda x: x and 'bedroom' in x.lower())
-            if title_elem:
-                unit_info['name'] = title_elem.get_text().strip()
+            if title:
+                unit_info['name'] = _clean_text(title)
             
             # Extract availability status
-            availability_elem = container.find(string=lambda x: x and any(
-                keyword in x.lower() for keyword in ['available', 'vacant', 'ready']
-            ))
-            if availability_elem:
-                unit_info['availability'] = availability_elem.strip()
+            availability_match = _AVAILABILITY_PATTERN.search(text)
+            if availability_match:
+                unit_info['availability'] = _clean_text(availability_match.group())
             
             # Extract rent price
-            price_elem = container.find(string=lambda x: x and '$' in x)
-            if price_elem:
-                unit_info['price'] = price_elem.strip()
+            price_match = _PRICE_PATTERN.search(text)
+            if price_match:
+                unit_info['price'] = price_match.group()
             
             # Extract square footage
-            sqft_elem = container.find(string=lambda x: x and ('sq ft' in x.lower() or 'sqft' in x.lower()))
-            if sqft_elem:
-                unit_info['sqft'] = sqft_elem.strip()
+            sqft_match = _SQFT_PATTERN.search(text)
+            if sqft_match:
+                unit_info['sqft'] = _clean_text(sqft_match.group())
             
             return unit_info if unit_info else None
             
@@ -127,98 +624,235 @@ class LincolnCommonsMonitor:
             logger.error(f"Error extracting unit info: {e}")
             return None
     
-    def send_notification(self, available_units: List[Dict[str, str]]):
+    def create_email(self, available_units: List[Dict[str, str]],
+                     checked_at: Optional[str] = None) -> Tuple[str, str]:
+        """Build the notification subject and body for the available units
+        
+        checked_at is the time of the check that found them, defaulting to now.
+        """
+        subject = f"ARO Units Available at Lincoln Commons - {len(available_units)} unit(s)"
+        
+        units = ''.join(
+            _UNIT_TEMPLATE.format(
+                index=i,
+                name=unit.get('name', 'N/A'),
+                availability=unit.get('availability', 'N/A'),
+                price=unit.get('price', 'N/A'),
+                sqft=unit.get('sqft', 'N/A')
+            )
+            for i, unit in enumerate(available_units, 1)
+        )
+        body = _EMAIL_TEMPLATE.format(
+            count=len(available_units),
+            units=units,
+            url=self.base_url,
+            timestamp=checked_at or _timestamp()
+        )
+        return subject, body
+    
+    def send_notification(self, available_units: List[Dict[str, str]], checked_at: Optional[str] = None):
         """Send notification about available units"""
         if not available_units:
             return
         
+        # The same units stay listed for days; only notify when the list changes
+        digest = _units_digest(available_units)
+        if digest == self._cache.get('last_notify_hash'):
+            logger.info("Units unchanged since last notification, not notifying again")
+            return
+        
         try:
-            subject = f"ARO Units Available at Lincoln Commons - {len(available_units)} unit(s)"
-            
-            # Build email body
-            body = f"""
-ARO One-Bedroom Units Available at Lincoln Commons!
-
-Found {len(available_units)} available ARO one-bedroom unit(s):
-
-"""
-            
-            for i, unit in enumerate(available_units, 1):
-                body += f"""
-Unit {i}:
-- Name: {unit.get('name', 'N/A')}
-- Availability: {unit.get('availability', 'N/A')}
-- Price: {unit.get('price', 'N/A')}
-- Square Footage: {unit.get('sqft', 'N/A')}
-
-"""
-            
-            body += f"""
-Check the website for more details and to apply:
-{self.base_url}
-
-This alert was generated at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-"""
+            # Build the message once, separately from sending it
+            subject, body = self.create_email(available_units, checked_at)
             
-            self.send_email(subject, body)
-            logger.info(f"Notification sent for {len(available_units)} available units")
+            if self.send_email(subject, body):
+                self._cache['last_notify_hash'] = digest
+                self._save_cache()
+                logger.info(f"Notification sent for {len(available_units)} available units")
             
         except Exception as e:
             logger.error(f"Error sending notification: {e}")
     
-    def send_email(self, subject: str, body: str):
-        """Send email notification"""
+    def send_email(self, subject: str, body: str) -> bool:
+        """Send email notification, returning whether it was sent"""
+        # Imported here: most checks find nothing and never need the email stack
+        import smtplib
+        from email.message import EmailMessage
+        
         try:
-            msg = MIMEMultipart()
+            msg = EmailMessage()
             msg['From'] = EMAIL_SETTINGS['smtp_user']
             msg['To'] = NOTIFICATION_SETTINGS['recipient_email']
             msg['Subject'] = subject
+            msg.set_content(body)
             
-            msg.attach(MIMEText(body, 'plain'))
-            
-            server = smtplib.SMTP(EMAIL_SETTINGS['smtp_server'], EMAIL_SETTINGS['smtp_port'])
-            server.starttls()
-            server.login(EMAIL_SETTINGS['smtp_user'], EMAIL_SETTINGS['smtp_password'])
-            
-            text = msg.as_string()
-            server.sendmail(EMAIL_SETTINGS['smtp_user'], NOTIFICATION_SETTINGS['recipient_email'], text)
-            server.quit()
+            try:
+                self._get_smtp().send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                # The connection dropped after the liveness check; reconnect once
+                self.close()
+                self._get_smtp().send_message(msg)
             
             logger.info("Email notification sent successfully")
+            return True
             
         except Exception as e:
             logger.error(f"Error sending email: {e}")
+            return False
     
-    def check_availability(self):
-        """Main method to check for available ARO units"""
-        logger.info("Starting apartment availability check")
+    def _load_cache(self) -> Dict:
+        """Load the state saved by the previous run, if any"""
+        try:
+            with open(CACHE_FILE, 'rb') as f:
+                cache = _loads(f.read())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cache file {CACHE_FILE}: {e}")
+            return {}
+        if not isinstance(cache, dict):
+            logger.warning(f"Ignoring unreadable cache file {CACHE_FILE}: not a JSON object")
+            return {}
         
-        soup = self.fetch_page()
-        if not soup:
-            logger.error("Failed to fetch page, skipping check")
+        if cache.get('cache_version') != _CACHE_VERSION:
+            # Re-fetch and re-parse with the current code. The notification hash
+            # depends only on the units found, so it still prevents a repeat email.
+            logger.info(f"Cache file {CACHE_FILE} was written by a different version of the monitor, starting fresh")
+            return {key: cache[key] for key in ('last_notify_hash',) if key in cache}
+        return cache
+    
+    def _save_cache(self):
+        """Save state for the next run"""
+        try:
+            self._cache['cache_version'] = _CACHE_VERSION
+            with open(CACHE_FILE, 'wb') as f:
+                f.write(_dumps(self._cache))
+        except OSError as e:
+            logger.warning(f"Error writing cache file {CACHE_FILE}: {e}")
+    
+    def _get_smtp(self) -> 'smtplib.SMTP':
+        """Return a logged-in SMTP connection, reconnecting if the cached one has dropped"""
+        import smtplib
+        
+        if self._smtp is not None:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except OSError:  # includes smtplib.SMTPException
+                pass
+            self.close()
+        
+        server = smtplib.SMTP(EMAIL_SETTINGS['smtp_server'], EMAIL_SETTINGS['smtp_port'])
+        server.starttls()
+        server.login(EMAIL_SETTINGS['smtp_user'], EMAIL_SETTINGS['smtp_password'])
+        self._smtp = server
+        return server
+    
+    def close(self):
+        """Close the cached SMTP connection, if any"""
+        if self._smtp is None:
             return
         
-        available_units = self.find_aro_units(soup)
+        try:
+            self._smtp.quit()
+        except OSError:  # includes smtplib.SMTPException
+            pass
+        self._smtp = None
+    
+    def check_availability(self) -> Optional[List[Dict[str, str]]]:
+        """Main method to check for available ARO units
+        
+        Returns the available units, or None if the page could not be checked.
+        """
+        logger.info("Starting apartment availability check")
+        checked_at = _timestamp()
+        
+        # The floorplans API, when configured, replaces scraping the page
+        available_units = self.fetch_api_units()
+        if available_units is None:
+            root = self.fetch_page()
+            if root is None:
+                logger.error("Failed to fetch page, skipping check")
+                return None
+            available_units = root if root is NOT_MODIFIED else self.find_aro_units(root)
+        if available_units is NOT_MODIFIED:
+            logger.info("No changes since last check, skipping unit search")
+            self._cache['consecutive_unchanged'] = self._cache.get('consecutive_unchanged', 0) + 1
+            self._save_cache()
+            # Retries a notification that failed on an earlier check; units that
+            # were already notified are skipped by send_notification
+            cached_units = self._cache.get('units')
+            self.send_notification(cached_units, checked_at)
+            return cached_units
+        
+        self._cache['units'] = available_units
+        self._cache['consecutive_unchanged'] = 0
+        self._cache['last_change'] = checked_at
+        if not available_units:
+            # Units that are listed again later should be reported again
+            self._cache.pop('last_notify_hash', None)
+        self._save_cache()
         
         if available_units:
             logger.info(f"Found {len(available_units)} available ARO units!")
-            self.send_notification(available_units)
+            self.send_notification(available_units, checked_at)
         else:
             logger.info("No ARO one-bedroom units currently available")
         
         logger.info("Apartment availability check completed")
+        return available_units
+    
+    def next_interval(self, interval_seconds: float, max_interval_seconds: float) -> float:
+        """Return the delay before the next check
+        
+        The interval doubles with each check that found the page unchanged, up to
+        max_interval_seconds, and drops back to interval_seconds once it changes.
+        """
+        unchanged = self._cache.get('consecutive_unchanged', 0)
+        return min(max_interval_seconds, interval_seconds * 2 ** min(unchanged, _MAX_BACKOFF_DOUBLINGS))
+    
+    def run_continuously(self, interval_seconds: float, max_interval_seconds: float):
+        """Check availability until stop() is called, backing off while the page is unchanged"""
+        logger.info(f"Checking every {interval_seconds:g} to {max_interval_seconds:g} seconds")
+        while not self._stop_event.is_set():
+            started = time.monotonic()
+            self.check_availability()
+            delay = self.next_interval(interval_seconds, max_interval_seconds)
+            logger.info(f"Next check in {delay:g} seconds")
+            # Sleep until the next check is due; stop() wakes this immediately
+            self._stop_event.wait(max(0.0, started + delay - time.monotonic()))
+    
+    def stop(self):
+        """Stop run_continuously after the current check"""
+        self._stop_event.set()
 
 def main():
     """Main function"""
+    parser = argparse.ArgumentParser(description="Monitor Lincoln Commons for ARO one-bedroom availability")
+    parser.add_argument('--loop', action='store_true',
+                        help="keep running, checking every check_interval_minutes and backing off "
+                             "towards max_interval_minutes while the page is unchanged (for local runs)")
+    args = parser.parse_args()
+    
+    monitor = LincolnCommonsMonitor()
     try:
-        monitor = LincolnCommonsMonitor()
-        monitor.check_availability()
+        if args.loop:
+            # Finish the current check and exit cleanly; a single check keeps the
+            # default handler so SIGTERM still ends it immediately
+            signal.signal(signal.SIGTERM, lambda signum, frame: monitor.stop())
+            interval_minutes = MONITORING_SETTINGS['check_interval_minutes']
+            max_interval_minutes = MONITORING_SETTINGS.get('max_interval_minutes', interval_minutes)
+            monitor.run_continuously(interval_minutes * 60, max(interval_minutes, max_interval_minutes) * 60)
+        else:
+            monitor.check_availability()
         
     except KeyboardInterrupt:
         logger.info("Monitoring stopped by user")
     except Exception as e:
         logger.error(f"Unexpected error: {e}")
         raise
+    finally:
+        monitor.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
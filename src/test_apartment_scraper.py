@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Tests for ARO unit parsing in apartment_scraper
+
+Pages are built inline, so no network access or site snapshot is needed.
+Run with: python -m unittest test_apartment_scraper (from src/)
+"""
+
+import sys
+import types
+import unittest
+
+import lxml.html
+
+# apartment_scraper reads its settings from config.py; fall back to the
+# example values when it has not been set up
+try:
+    import config  # noqa: F401
+except ImportError:
+    config = types.ModuleType('config')
+    config.EMAIL_SETTINGS = {
+        'smtp_server': 'smtp.gmail.com',
+        'smtp_port': 587,
+        'smtp_user': 'your-email@gmail.com',
+        'smtp_password': 'your-app-password',
+    }
+    config.NOTIFICATION_SETTINGS = {
+        'recipient_email': 'recipient@example.com',
+        'send_email': True,
+        'send_sms': False,
+    }
+    config.MONITORING_SETTINGS = {
+        'check_interval_minutes': 60,
+        'timeout_seconds': 30,
+        'max_retries': 3,
+    }
+    sys.modules['config'] = config
+
+from apartment_scraper import LincolnCommonsMonitor
+
+CARD = """
+<div class="floorplan-card">
+  <h3>1 Bedroom ARO</h3>
+  <div class="unit-price">$1,250</div>
+  <div class="unit-size">650 sq ft</div>
+  <p>Available Now</p>
+</div>
+"""
+
+CARD_UNIT = {
+    'name': '1 Bedroom ARO',
+    'availability': 'Available Now',
+    'price': '$1,250',
+    'sqft': '650 sq ft',
+}
+
+
+def find_units(html):
+    """Parse html and return the units find_aro_units reports for it"""
+    monitor = LincolnCommonsMonitor.__new__(LincolnCommonsMonitor)
+    return monitor.find_aro_units(lxml.html.fromstring(html))
+
+
+class FindAroUnitsTest(unittest.TestCase):
+
+    def test_region_scope_matches_whole_page(self):
+        listings = f'<section id="floorplans">{CARD}</section>'
+        page = f"""
+        <html><body>
+          <nav class="menu"><a>Apartments</a><a>Affordable housing</a></nav>
+          {listings}
+          <footer class="site-footer">Equal housing opportunity</footer>
+        </body></html>
+        """
+        self.assertEqual(find_units(page), [CARD_UNIT])
+        self.assertEqual(find_units(page), find_units(f'<html><body>{listings}</body></html>'))
+
+    def test_region_excludes_units_outside_listings(self):
+        page = f"""
+        <html><body>
+          <div class="unit-promo"><h3>1 Bedroom ARO</h3> $999</div>
+          <main>{CARD}</main>
+        </body></html>
+        """
+        self.assertEqual(find_units(page), [CARD_UNIT])
+
+    def test_card_with_matching_children(self):
+        page = f'<html><body><main><section class="floorplans-list">{CARD}</section></main></body></html>'
+        self.assertEqual(find_units(page), [CARD_UNIT])
+
+    def test_nested_cards_reported_once_in_page_order(self):
+        page = f"""
+        <html><body><main><section class="floorplans-list">
+          {CARD}
+          <div class="floorplan-card"><h3>1 Bedroom ARO Plus</h3><p>$1,300</p></div>
+          <div class="floorplan-card"><h3>2 Bedroom</h3><div class="unit-price">$2,000</div></div>
+        </section></main></body></html>
+        """
+        self.assertEqual(
+            find_units(page),
+            [CARD_UNIT, {'name': '1 Bedroom ARO Plus', 'price': '$1,300'}]
+        )
+
+    def test_bedroom_run_together_with_number(self):
+        page = '<html><body><main><div class="floorplan-card">1Bedroom ARO available $1,000</div></main></body></html>'
+        self.assertEqual(find_units(page), [{'availability': 'available', 'price': '$1,000'}])
+
+    def test_aro_inside_word_is_not_aro(self):
+        page = '<html><body><main><div class="floorplan-card"><h3>1 Bedroom</h3> Carousel $2,100</div></main></body></html>'
+        self.assertEqual(find_units(page), [])
+
+    def test_table_with_beds_and_type_columns(self):
+        page = f"""
+        <html><body><main>
+          <table>
+            <tr><th>Unit</th><th>Beds</th><th>Type</th><th>Rent</th><th>Availability</th></tr>
+            <tr><td>101</td><td>1</td><td>ARO</td><td>$1,100</td><td>Now</td></tr>
+            <tr><td>102</td><td>10</td><td>ARO</td><td>$1,500</td><td>Now</td></tr>
+            <tr><td>103</td><td>1</td><td>Market</td><td>$2,100</td><td>Now</td></tr>
+            <tr><td>104</td><td>2</td><td>ARO</td><td>$1,400</td><td>Now</td></tr>
+          </table>
+          {CARD}
+        </main></body></html>
+        """
+        self.assertEqual(find_units(page), [{'name': '101', 'price': '$1,100', 'availability': 'Now'}])
+
+    def test_table_unit_type_column_is_not_the_name(self):
+        page = """
+        <html><body><main><table>
+          <tr><th>Unit Type</th><th>Unit</th><th>Beds</th><th>Rent</th></tr>
+          <tr><td>ARO</td><td>#204</td><td>1</td><td>$1,150</td></tr>
+        </table></main></body></html>
+        """
+        self.assertEqual(find_units(page), [{'name': '#204', 'price': '$1,150'}])
+
+    def test_table_units_available_column_is_availability(self):
+        page = """
+        <html><body><main><table>
+          <tr><th>Floor Plan</th><th>Beds</th><th>Units Available</th><th>Rent</th></tr>
+          <tr><td>ARO A1</td><td>1</td><td>2</td><td>$1,100</td></tr>
+          <tr><td>Market A1</td><td>1</td><td>3</td><td>$2,100</td></tr>
+        </table></main></body></html>
+        """
+        self.assertEqual(find_units(page), [{'name': 'ARO A1', 'availability': '2', 'price': '$1,100'}])
+
+    def test_table_without_matches_falls_back_to_cards(self):
+        page = f"""
+        <html><body><main>
+          <table>
+            <tr><th>Unit</th><th>Beds</th><th>Type</th><th>Rent</th></tr>
+            <tr><td>103</td><td>1</td><td>Market</td><td>$2,100</td></tr>
+          </table>
+          {CARD}
+        </main></body></html>
+        """
+        self.assertEqual(find_units(page), [CARD_UNIT])
+
+    def test_no_aro_listing(self):
+        page = '<html><body><main><div class="floorplan-card"><h3>1 Bedroom</h3> $2,100</div></main></body></html>'
+        self.assertEqual(find_units(page), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,31 +8,38 @@ Run this after setting up your config.py file.
 
 import sys
 import os
+import importlib.util
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional
+
+SITE_URL = "https://www.lincolncommonapartments.com/floorplans"
+
+# HTTP session for the network checks, created on first use so a missing
+# requests install is reported by test_imports rather than failing here
+_SHARED_SESSION = None
+
+def _get_session():
+    """Return the shared HTTP session, creating it on first use"""
+    global _SHARED_SESSION
+    if _SHARED_SESSION is None:
+        import requests
+        _SHARED_SESSION = requests.Session()
+        _SHARED_SESSION.headers['User-Agent'] = (
+            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+            '(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+        )
+    return _SHARED_SESSION
 
 def test_imports():
-    """Test that all required modules can be imported"""
+    """Test that all required modules are installed"""
     print("Testing imports...")
     
-    try:
-        import requests
-        print("✓ requests module available")
-    except ImportError:
-        print("✗ requests module missing - run: pip install -r requirements.txt")
-        return False
-    
-    try:
-        from bs4 import BeautifulSoup
-        print("✓ beautifulsoup4 module available")
-    except ImportError:
-        print("✗ beautifulsoup4 module missing - run: pip install -r requirements.txt")
-        return False
-    
-    try:
-        import schedule
-        print("✓ schedule module available")
-    except ImportError:
-        print("✗ schedule module missing - run: pip install -r requirements.txt")
-        return False
+    # find_spec only locates each package, without importing and running it
+    for module in ('requests', 'lxml', 'schedule'):
+        if importlib.util.find_spec(module) is None:
+            print(f"✗ {module} module missing - run: pip install -r requirements.txt")
+            return False
+        print(f"✓ {module} module available")
     
     return True
 
@@ -60,17 +67,29 @@ def test_config():
         print("  Please ensure src/config.py exists and is properly formatted")
         return False
 
-def test_network():
-    """Test network connectivity to Lincoln Commons"""
+def _request_site():
+    """Request the Lincoln Commons page headers and return the response"""
+    # HEAD is enough to prove the site is reachable, without downloading the page
+    return _get_session().head(SITE_URL, timeout=10, allow_redirects=True)
+
+def test_network(pending_request: Optional[Future] = None):
+    """Test network connectivity to Lincoln Commons
+    
+    pending_request is a request already started in the background by main().
+    """
     print("\nTesting network connectivity...")
     
     try:
-        import requests
-        url = "https://www.lincolncommonapartments.com/floorplans"
-        response = requests.get(url, timeout=10)
+        if pending_request is not None:
+            response = pending_request.result()
+        else:
+            response = _request_site()
         
-        if response.status_code == 200:
+        if response.status_code in (200, 301, 302):
             print("✓ Successfully connected to Lincoln Commons website")
+            content_length = response.headers.get('Content-Length')
+            if content_length and content_length.isdigit():
+                print(f"  Page size: {int(content_length):,} bytes")
             return True
         else:
             print(f"⚠ Warning: Received status code {response.status_code} from website")
@@ -88,17 +107,21 @@ def main():
     
     all_passed = True
     
-    # Test imports
-    if not test_imports():
-        all_passed = False
-    
-    # Test configuration
-    if not test_config():
-        all_passed = False
-    
-    # Test network
-    if not test_network():
-        all_passed = False
+    # Start the network request first so it is in flight while the local checks run
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending_request = executor.submit(_request_site)
+        
+        # Test imports
+        if not test_imports():
+            all_passed = False
+        
+        # Test configuration
+        if not test_config():
+            all_passed = False
+        
+        # Test network
+        if not test_network(pending_request):
+            all_passed = False
     
     print("\n" + "=" * 40)
     if all_passed: